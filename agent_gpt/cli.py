@@ -18,16 +18,16 @@ import re
 import time
 import yaml
 import json
-import websocket
-from .core import AgentGPT
-from .config.sagemaker import SageMakerConfig
-from .config.hyperparams import Hyperparameters
-from typing import Optional, Dict
-import requests 
+from typing import Optional, Dict, TYPE_CHECKING
 from .simulation import open_simulation_in_screen
 from .utils.config_utils import load_config, save_config, generate_default_section_config, update_config_using_method, ensure_config_exists
 from .utils.config_utils import convert_to_objects, parse_extra_args, update_config_by_dot_notation
 from .utils.config_utils import DEFAULT_CONFIG_PATH, TOP_CONFIG_CLASS_MAP
+from .utils.config_utils import SafeLoader
+
+if TYPE_CHECKING:  # annotations only; the config classes load on demand via TOP_CONFIG_CLASS_MAP
+    from .config.sagemaker import SageMakerConfig
+    from .config.hyperparams import Hyperparameters
 
 app = typer.Typer(add_completion=False, invoke_without_command=True)
 
@@ -35,7 +35,7 @@ def load_help_texts(yaml_filename: str) -> Dict:
     script_dir = os.path.dirname(os.path.abspath(__file__))
     yaml_path = os.path.join(script_dir, yaml_filename)
     with open(yaml_path, "r", encoding="utf-8") as f:
-        return yaml.load(f, Loader=yaml.FullLoader)
+        return yaml.load(f, Loader=SafeLoader)
 
 def auto_format_help(text: str) -> str:
     formatted = re.sub(r'([.:])\s+', r'\1\n\n', text)
@@ -178,6 +178,7 @@ def wait_for_config_update(sent_remote_training_key, timeout=10):
     raise TimeoutError("Timed out waiting for config update.")
 
 def connect_to_agent_gpt_server(region: str, env_config: Dict) -> str:
+    import websocket  # Only the simulate command talks to the server.
     
     ws = websocket.WebSocket()
     if region not in ["us-east-1", "us-east-2", "ap-northeast-2"]:
@@ -308,6 +309,7 @@ def initialize_sagemaker_access(
     
     headers = {'Content-Type': 'application/json'}
     
+    import requests  # Only needed for registration; keeps CLI startup light.
     try:
         response = requests.post(beta_register_url, json=payload, headers=headers)
     except Exception:
@@ -412,10 +414,11 @@ def train():
         input_config[name] = config_data.get(name, {})
     converted_obj = convert_to_objects(input_config)
     
-    sagemaker_obj: SageMakerConfig = converted_obj["sagemaker"]
-    hyperparams_config: Hyperparameters = converted_obj["hyperparams"]
+    sagemaker_obj: "SageMakerConfig" = converted_obj["sagemaker"]
+    hyperparams_config: "Hyperparameters" = converted_obj["hyperparams"]
     
     typer.echo("Submitting training job...")
+    from .core import AgentGPT  # boto3/sagemaker are slow to import; only train/infer need them.
     estimator = AgentGPT.train(sagemaker_obj, hyperparams_config)
     typer.echo(f"Training job submitted: {estimator.latest_training_job.name}")
 
@@ -480,10 +483,11 @@ def infer():
     input_config = {name: config_data.get(name, {}) for name in input_config_names}
     converted_obj = convert_to_objects(input_config)
     
-    sagemaker_obj: SageMakerConfig = converted_obj["sagemaker"]
+    sagemaker_obj: "SageMakerConfig" = converted_obj["sagemaker"]
 
     typer.echo("Deploying inference endpoint...")
     
+    from .core import AgentGPT
     gpt_api = AgentGPT.infer(sagemaker_obj)
     
     typer.echo(f"Inference endpoint deployed: {gpt_api.endpoint_name}")
@@ -0,0 +1,97 @@
+"""
+Generated per-class methods for the config dataclasses.
+
+`dataclasses.asdict` rediscovers the fields and recurses through a generic
+helper on every call. `fast_to_dict` writes a straight-line `to_dict` per
+class once, at import time, with the field names baked into a dict literal.
+The result is the same nested dict asdict would return.
+
+`tuple_pickle_state` separately generates `__getstate__`/`__setstate__` that
+pickle the field values as a tuple instead of the instance `__dict__`.
+"""
+import copy
+import types
+from dataclasses import fields
+
+# Types deepcopy returns unchanged; asdict_fast passes them through as-is.
+_ATOMIC_TYPES = frozenset((
+    type(None), bool, int, float, complex, str, bytes,
+    type, range, property, types.FunctionType, types.BuiltinFunctionType,
+    type(Ellipsis), type(NotImplemented),
+))
+
+def _dataclass_to_dict(obj):
+    return {f.name: asdict_fast(getattr(obj, f.name)) for f in fields(obj)}
+
+def asdict_fast(obj):
+    """
+    Same result as `dataclasses.asdict` (for dataclass instances) and its
+    per-value conversion (for anything else), but atomic values skip deepcopy
+    and decorated classes use their generated `to_dict`.
+    """
+    obj_type = type(obj)
+    if obj_type in _ATOMIC_TYPES:
+        return obj
+    to_dict = getattr(obj_type, "__to_dict__", None)
+    if to_dict is not None:
+        return to_dict(obj)
+    if hasattr(obj_type, "__dataclass_fields__"):
+        return _dataclass_to_dict(obj)
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return obj_type(*[asdict_fast(v) for v in obj])
+    if isinstance(obj, (list, tuple)):
+        return obj_type(asdict_fast(v) for v in obj)
+    if isinstance(obj, dict):
+        return obj_type((asdict_fast(k), asdict_fast(v)) for k, v in obj.items())
+    return copy.deepcopy(obj)
+
+def fast_to_dict(cls):
+    """
+    Class decorator (apply above @dataclass) that adds a generated `to_dict`,
+    equivalent to `dataclasses.asdict(self)`, and a `__field_names__` frozenset
+    for O(1) field-name checks (e.g. in set_config).
+    """
+    cls.__field_names__ = frozenset(f.name for f in fields(cls))
+    body = ", ".join(f"{f.name!r}: asdict_fast(self.{f.name})" for f in fields(cls))
+    namespace = {}
+    source = (
+        "def to_dict(self):\n"
+        "    if type(self) is not cls:\n"
+        "        return _dataclass_to_dict(self)  # undecorated subclass; may have extra fields\n"
+        f"    return {{{body}}}\n"
+    )
+    exec(source, {"asdict_fast": asdict_fast, "_dataclass_to_dict": _dataclass_to_dict, "cls": cls}, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__module__ = cls.__module__
+    to_dict.__doc__ = "Returns a nested dictionary of all fields (same result as dataclasses.asdict)."
+    cls.to_dict = cls.__to_dict__ = to_dict
+    return cls
+
+def tuple_pickle_state(cls):
+    """
+    Class decorator (apply above @dataclass) that adds generated
+    __getstate__/__setstate__, pickling the field values as a tuple in field
+    order instead of the instance __dict__.
+    """
+    names = [f.name for f in fields(cls)]
+    targets = "".join(f"self.{name}, " for name in names)
+    source = (
+        "def __getstate__(self):\n"
+        "    if type(self) is not cls:\n"
+        "        return self.__dict__\n"
+        f"    return ({targets})\n"
+        "def __setstate__(self, state):\n"
+        "    if type(state) is dict:  # subclass instance or a pickle from before this change\n"
+        "        self.__dict__.update(state)\n"
+        "        return\n"
+        f"    {targets} = state\n"
+    )
+    namespace = {}
+    exec(source, {"cls": cls}, namespace)
+    for name in ("__getstate__", "__setstate__"):
+        method = namespace[name]
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+        method.__module__ = cls.__module__
+        setattr(cls, name, method)
+    return cls
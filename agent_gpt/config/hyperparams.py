@@ -39,9 +39,13 @@ gpt_type             : (str)    GPT variant (e.g., "gpt2", "gpt-neo", etc.) from
 -------------------------------------------------------------------
 """
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field, fields
 from typing import Optional, List, Dict
+from ._fastdict import fast_to_dict, tuple_pickle_state
 
+@tuple_pickle_state
+@fast_to_dict
 @dataclass
 class Exploration:
     """
@@ -70,36 +74,53 @@ class Exploration:
     
     def _fields_for_type(self) -> List[str]:
         """Returns a list of field names relevant to the specified exploration type."""
-        if self.type == "none":
-            return ["type"]
-        elif self.type == "epsilon_greedy":
-            return ["type", "initial_epsilon", "final_epsilon"]
-        elif self.type == "gaussian_noise":
-            return ["type", "initial_sigma", "final_sigma"]
-        elif self.type == "ornstein_uhlenbeck":
-            return ["type", "mu", "theta", "ou_sigma", "dt"]
-        elif self.type == "parameter_noise":
-            return ["type", "initial_stddev", "final_stddev"]
-        else:
+        fields_for_type = _FIELDS_BY_TYPE.get(self.type)
+        if fields_for_type is None:
             raise ValueError(f"Invalid exploration type: '{self.type}'")
+        return list(fields_for_type)
 
     def __post_init__(self):
         """
         After the dataclass is initialized, blank out any fields that are not 
         relevant to the chosen exploration type.
         """
-        try:
-            fields_for_type = self._fields_for_type()
-        except ValueError as e:
+        if type(self.type) is str:
+            self.type = sys.intern(self.type)
+        pruner = _PRUNERS.get(self.type)
+        if pruner is None:
             # If user provided an invalid exploration type, we won't prune anything
-            print("[WARNING]", e)
+            print("[WARNING]", f"Invalid exploration type: '{self.type}'")
             return
-
-        # For each field in this object, set it to None if it's not relevant
-        for field_name in vars(self):
-            if field_name not in fields_for_type:
-                setattr(self, field_name, None)
+        pruner(self)
+
+# Field names kept for each exploration type; everything else is set to None.
+_FIELDS_BY_TYPE = {
+    "none": ("type",),
+    "epsilon_greedy": ("type", "initial_epsilon", "final_epsilon"),
+    "gaussian_noise": ("type", "initial_sigma", "final_sigma"),
+    "ornstein_uhlenbeck": ("type", "mu", "theta", "ou_sigma", "dt"),
+    "parameter_noise": ("type", "initial_stddev", "final_stddev"),
+}
+
+def _build_pruners():
+    """
+    Generates one straight-line function per exploration type that assigns None
+    to exactly the irrelevant fields, instead of scanning vars(self) per instance.
+    """
+    field_names = [f.name for f in fields(Exploration)]
+    pruners = {}
+    for exploration_type, kept in _FIELDS_BY_TYPE.items():
+        body = "".join(f"    self.{name} = None\n" for name in field_names if name not in kept)
+        namespace = {}
+        # A type that keeps every field has nothing to prune.
+        exec("def prune(self):\n" + (body or "    pass\n"), {}, namespace)
+        pruners[exploration_type] = namespace["prune"]
+    return pruners
+
+_PRUNERS = _build_pruners()
         
+@tuple_pickle_state
+@fast_to_dict
 @dataclass
 class Hyperparameters:
 
@@ -139,6 +160,12 @@ class Hyperparameters:
     # -----------------------
     # Methods
     # -----------------------
+    def __post_init__(self):
+        # Hyperparameters(**loaded_dict) gets the same coercion as set_config:
+        # exploration dicts become Exploration objects, enum-like strings are interned.
+        for name in _COERCED_FIELDS:
+            _SETTERS[name](self, getattr(self, name))
+
     def set_exploration(
         self,
         key: str,
@@ -159,15 +186,46 @@ class Hyperparameters:
 
     def set_config(self, **kwargs):
         for k, v in kwargs.items():
-            if hasattr(self, k):
-                setattr(self, k, v)
+            setter = _SETTERS.get(k)
+            if setter is not None:
+                setter(self, v)
             else:
                 print(f"Warning: No attribute '{k}' in Hyperparameters")
 
-    def to_dict(self) -> Dict:
-        """
-        Returns a deep dictionary of all dataclass fields,
-        including nested dataclasses, by leveraging asdict().
-        """
-        return asdict(self)
-    
\ No newline at end of file
+    # to_dict() is generated by @fast_to_dict: a deep dictionary of all fields,
+    # including nested Exploration entries, identical to dataclasses.asdict().
+    
+
+def _set_exploration(self: Hyperparameters, value):
+    # Entries loaded from config.yaml arrive as plain dicts; rebuild them as
+    # Exploration unless they carry keys Exploration doesn't know. Exact type
+    # checks: Exploration isn't subclassed and yaml only produces plain dicts.
+    if type(value) is dict:
+        value = {
+            key: Exploration(**entry)
+            if type(entry) is dict and entry.keys() <= Exploration.__field_names__ else entry
+            for key, entry in value.items()
+        }
+    self.exploration = value
+
+# String fields drawn from a small fixed vocabulary; interned so copies parsed
+# from config.yaml or the CLI share one object and compare by identity.
+_INTERN_FIELDS = ("lr_scheduler", "gpt_type")
+
+def _intern_setter(name):
+    def setter(self, value):
+        setattr(self, name, sys.intern(value) if type(value) is str else value)
+    return setter
+
+def _build_setters():
+    """One setter per Hyperparameters field, so set_config is a single dict lookup per key."""
+    setters = {name: (lambda self, value, name=name: setattr(self, name, value))
+               for name in Hyperparameters.__field_names__}
+    setters["exploration"] = _set_exploration
+    for name in _INTERN_FIELDS:
+        setters[name] = _intern_setter(name)
+    return setters
+
+_SETTERS = _build_setters()
+# Fields whose setter does more than a plain setattr; re-applied in __post_init__.
+_COERCED_FIELDS = ("exploration",) + _INTERN_FIELDS
@@ -1,8 +1,11 @@
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict
+from dataclasses import dataclass, field
+from typing import Optional
+from ._fastdict import fast_to_dict, tuple_pickle_state
 
 CURRENT_AGENT_GPT_VERSION = "latest"  # Current Image Tag in ACCESIBLE_REGIONS
 
+@tuple_pickle_state
+@fast_to_dict
 @dataclass
 class TrainerConfig:
     DEFAULT_OUTPUT_PATH = "s3://your-bucket/input/"
@@ -11,6 +14,8 @@ class TrainerConfig:
     max_run: int = 3600
     output_path: Optional[str] = DEFAULT_OUTPUT_PATH
 
+@tuple_pickle_state
+@fast_to_dict
 @dataclass
 class InferenceConfig:
     DEFAULT_MODEL_DATA = "s3://your-bucket/model.tar.gz"
@@ -19,7 +24,10 @@ class InferenceConfig:
     instance_count: int = 1
     max_run: int = 3600
     model_data: Optional[str] = DEFAULT_MODEL_DATA
+    routing_strategy: Optional[str] = "LEAST_OUTSTANDING_REQUESTS"  # or "RANDOM"; None keeps SageMaker's default
     
+@tuple_pickle_state
+@fast_to_dict
 @dataclass
 class SageMakerConfig:
     role_arn: Optional[str] = "arn:aws:iam::<your-aws-account-id>:role/SageMakerExecutionRole"
@@ -41,9 +49,8 @@ class SageMakerConfig:
         # Construct the image URI dynamically based on region and service type.
         return f"533267316703.dkr.ecr.{self.region}.amazonaws.com/agent-gpt-{service_type}:{CURRENT_AGENT_GPT_VERSION}"
 
-    def to_dict(self) -> Dict:
-        """Returns a nested dictionary of the full SageMaker configuration."""
-        return asdict(self)
+    # to_dict() is generated by @fast_to_dict and returns a nested dictionary
+    # of the full SageMaker configuration.
     
     def set_config(self, **kwargs):
         """
@@ -53,17 +60,17 @@ class SageMakerConfig:
         for k, v in kwargs.items():
             if k == "trainer" and isinstance(v, dict):
                 for sub_key, sub_value in v.items():
-                    if hasattr(self.trainer, sub_key):
+                    if sub_key in self.trainer.__field_names__:
                         setattr(self.trainer, sub_key, sub_value)
                     else:
                         print(f"Warning: TrainerConfig has no attribute '{sub_key}'")
             elif k == "inference" and isinstance(v, dict):
                 for sub_key, sub_value in v.items():
-                    if hasattr(self.inference, sub_key):
+                    if sub_key in self.inference.__field_names__:
                         setattr(self.inference, sub_key, sub_value)
                     else:
                         print(f"Warning: InferenceConfig has no attribute '{sub_key}'")
-            elif hasattr(self, k):
+            elif k in self.__field_names__:
                 setattr(self, k, v)
             else:
                 print(f"Warning: No attribute '{k}' in SageMakerConfig")
\ No newline at end of file
@@ -4,15 +4,43 @@
 ###############################################################################
 import re
 import time
-import boto3
-from sagemaker import Model 
-from sagemaker.estimator import Estimator
-from sagemaker.predictor import Predictor
+import functools
 
 from .config.sagemaker import SageMakerConfig
 from .config.hyperparams import Hyperparameters
 from .gpt_api import GPTAPI
 
+# boto3 and the sagemaker SDK take seconds to import, so they are imported
+# where a job or endpoint is actually created rather than at module load.
+
+# Every GPTAPI call is an InvokeEndpoint round trip; keep connections alive
+# and pooled so calls don't pay a fresh TCP+TLS handshake.
+RUNTIME_CLIENT_OPTIONS = {
+    "tcp_keepalive": True,
+    "max_pool_connections": 50,
+}
+
+# Endpoint states that settle into InService on their own.
+ENDPOINT_TRANSITIONAL_STATUSES = ("Creating", "Updating", "SystemUpdating")
+
+@functools.lru_cache(maxsize=None)
+def _sagemaker_session():
+    """
+    One sagemaker.Session per process, so credential resolution and the
+    sagemaker / sagemaker-runtime connection pools are set up once and shared
+    by every train/infer call.
+    """
+    import boto3
+    from botocore.config import Config
+    from sagemaker import Session
+
+    boto_session = boto3.Session()
+    return Session(
+        boto_session=boto_session,
+        sagemaker_client=boto_session.client("sagemaker"),
+        sagemaker_runtime_client=boto_session.client("sagemaker-runtime", config=Config(**RUNTIME_CLIENT_OPTIONS)),
+    )
+
 class AgentGPT:
     """
     AgentGPT is your one‑click solution for **training** and **running** a 
@@ -86,6 +114,8 @@ class AgentGPT:
         if trainer_config.output_path == trainer_config.DEFAULT_OUTPUT_PATH:
             raise ValueError("Invalid output_path: Please update the SageMaker trainer output_path to a valid S3 location.")
         
+        from sagemaker.estimator import Estimator
+
         image_uri = sagemaker_config.get_image_uri("trainer")
         hyperparams_dict = hyperparameters.to_dict()
 
@@ -97,7 +127,8 @@ class AgentGPT:
             output_path=trainer_config.output_path,
             max_run=trainer_config.max_run,
             region=sagemaker_config.region,
-            hyperparameters=hyperparams_dict
+            hyperparameters=hyperparams_dict,
+            sagemaker_session=_sagemaker_session()
         )
         estimator.fit()
         return estimator
@@ -134,11 +165,16 @@ class AgentGPT:
         if inference_config.model_data == inference_config.DEFAULT_MODEL_DATA:
             raise ValueError("Invalid model_data: Please update the SageMaker inference model_data to a valid S3 location.")
         
+        from sagemaker import Model
+        from sagemaker.predictor import Predictor
+
         image_uri = sagemaker_config.get_image_uri("inference")
+        sagemaker_session = _sagemaker_session()
         model = Model(
             role=sagemaker_config.role_arn,
             image_uri=image_uri,
-            model_data=inference_config.model_data
+            model_data=inference_config.model_data,
+            sagemaker_session=sagemaker_session
         )
         print("Created SageMaker Model:", model)
         
@@ -149,7 +185,7 @@ class AgentGPT:
             
         print("Using endpoint name:", endpoint_name)
 
-        sagemaker_client = boto3.client("sagemaker")
+        sagemaker_client = sagemaker_session.sagemaker_client
         try:
             desc = sagemaker_client.describe_endpoint(EndpointName=endpoint_name)
             endpoint_status = desc["EndpointStatus"]
@@ -160,16 +196,30 @@ class AgentGPT:
 
         if endpoint_exists:
             print(f"Reusing existing endpoint: {endpoint_name}")
+            if endpoint_status in ENDPOINT_TRANSITIONAL_STATUSES:
+                # Let botocore's waiter poll DescribeEndpoint instead of handing back
+                # a predictor whose first calls would fail.
+                print(f"Waiting for endpoint '{endpoint_name}' to be InService...")
+                sagemaker_client.get_waiter("endpoint_in_service").wait(
+                    EndpointName=endpoint_name,
+                    WaiterConfig={"Delay": 15, "MaxAttempts": 120},
+                )
             predictor = Predictor(
                 endpoint_name=endpoint_name,
                 sagemaker_session=model.sagemaker_session
             )
         else:
             print(f"Creating a new endpoint: {endpoint_name}")
+            deploy_kwargs = {}
+            if inference_config.routing_strategy:
+                # Least-outstanding-requests routing avoids queueing behind a busy
+                # instance; it is an endpoint setting, not a per-request option.
+                deploy_kwargs["routing_config"] = {"RoutingStrategy": inference_config.routing_strategy}
             new_predictor = model.deploy(
                 initial_instance_count=inference_config.instance_count,
                 instance_type=inference_config.instance_type,
-                endpoint_name=endpoint_name
+                endpoint_name=endpoint_name,
+                **deploy_kwargs
             )
             print("Deployed model to endpoint:", new_predictor)
             
@@ -182,5 +232,8 @@ class AgentGPT:
                     sagemaker_session=model.sagemaker_session
                 )    
 
-        # Return a GPTAPI client for inference calls
-        return GPTAPI(predictor)
\ No newline at end of file
+        # Return a GPTAPI client for inference calls, with its connection already
+        # open (the endpoint is InService at this point).
+        api = GPTAPI(predictor)
+        api.warmup()
+        return api
\ No newline at end of file
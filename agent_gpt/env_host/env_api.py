@@ -20,14 +20,36 @@ from ..utils.conversion_utils import (
 )
 
 WEBSOCKET_TIMEOUT = 1
+SOCKET_BUFFER_SIZE = 1 << 20
+# Applied before connect so the receive window can scale; websocket-client
+# already enables TCP keepalive by default.
+SOCKET_OPTIONS = (
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE),
+)
+STEP_RESULT_KEYS = ("observation", "reward", "terminated", "truncated", "info")
+HEARTBEAT_MESSAGE = "Training hasn't started yet but I am still alive."
+# The heartbeat body never changes, so encode it once instead of per send.
+HEARTBEAT_PAYLOAD = json.dumps({"action": "event", "message": HEARTBEAT_MESSAGE, "type": "heartbeat"})
+
 class EnvAPI:
     def __init__(self, env_wrapper, remote_training_key, agent_gpt_server_url, 
-               env_idx, num_agents):
+               env_idx, num_agents, shutdown_event=None):
         self.env_wrapper = env_wrapper
         self.environments = {}
+        # Packed space responses per env_key; spaces don't change after make.
+        self._observation_space_cache = {}
+        self._action_space_cache = {}
+        # Per-env_key step functions with the env and converters bound at make time.
+        self._step_fns = {}
         self.env_idx = env_idx
-        self.shutdown_event = threading.Event()
-        self.ws = websocket.WebSocket()
+        # Launchers may share one event so a single set() stops all of them.
+        self.shutdown_event = shutdown_event if shutdown_event is not None else threading.Event()
+        # Frames are base64 msgpack handled only by this thread: skip the UTF-8
+        # validation and the per-call send/recv locks.
+        self.ws = websocket.WebSocket(sockopt=SOCKET_OPTIONS, skip_utf8_validation=True,
+                                      enable_multithread=False)
         print("Connecting to Agent GPT server..., ", agent_gpt_server_url)
         self.patience = 60
         self.patience_threshold = 60
@@ -43,20 +65,23 @@ class EnvAPI:
         for env_key in list(self.environments.keys()):
             self.environments[env_key].close()  
             del self.environments[env_key]
+        self._observation_space_cache.clear()
+        self._action_space_cache.clear()
+        self._step_fns.clear()
     
     def check_alive(self):
         self.patience += 1
         if self.patience > self.patience_threshold:
-            heartbeat_message = "Training hasn't started yet but I am still alive."
             if self.env_idx == 0:
-                print("Sending heartbeat: ", heartbeat_message)
-            self.send_message("event", message=heartbeat_message, type="heartbeat")
+                print("Sending heartbeat: ", HEARTBEAT_MESSAGE)
+            self.ws.send(HEARTBEAT_PAYLOAD)
             self.patience = 0         
               
     def communicate(self):
         while not self.shutdown_event.is_set():
             try:
-                packed_request = self.ws.recv()
+                # recv_data hands back the raw frame bytes without decoding them to str.
+                opcode, packed_request = self.ws.recv_data()
                 self.patience = 0
             except (socket.timeout, WebSocketTimeoutException):
                 self.check_alive()
@@ -67,12 +92,16 @@ class EnvAPI:
             except Exception as e:
                 logging.exception("WebSocket receiving error: %s", e)
                 continue
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                logging.warning("WebSocket connection closed by server.")
+                break
             try:
                 # Unpack received request payload
                 payload = self.unpack_request(packed_request)
                 data = payload.get("data", {})
                 method = data.get("method")
                 env_key = data.get("env_key")
+                packed_response = None
 
                 # Execute method based on request
                 if method == "make":
@@ -83,16 +112,19 @@ class EnvAPI:
                     result = self.reset(env_key, data.get("seed"), data.get("options"))
                 elif method == "step":
                     result = self.step(env_key, data.get("action"))
+                elif method == "step_batch":
+                    result = self.step_batch(data.get("calls", []))
                 elif method == "close":
                     result = self.close(env_key)
                 elif method == "observation_space":
-                    result = self.observation_space(env_key)
+                    packed_response = self.observation_space(env_key)
                 elif method == "action_space":
-                    result = self.action_space(env_key)
+                    packed_response = self.action_space(env_key)
                 else:
                     result = self.send_message("event", message=f"Unknown method: {method}")
 
-                packed_response = self.pack_response(result)
+                if packed_response is None:
+                    packed_response = self.pack_response(result)
                 self.ws.send(packed_response)
 
             except Exception as e:
@@ -128,11 +160,17 @@ class EnvAPI:
     def make(self, env_key: str, env_id: str, render_mode: Optional[str] = None):
         env_instance = self.env_wrapper.make(env_id, render_mode=render_mode)
         self.environments[env_key] = env_instance
+        self._step_fns[env_key] = self._build_step_fn(env_instance)
+        self._observation_space_cache.pop(env_key, None)
+        self._action_space_cache.pop(env_key, None)
         return {"message": f"Environment {env_id} created.", "env_key": env_key}
 
     def make_vec(self, env_key: str, env_id: str, num_envs: int):
         env_instance = self.env_wrapper.make_vec(env_id, num_envs=num_envs)
         self.environments[env_key] = env_instance
+        self._step_fns[env_key] = self._build_step_fn(env_instance)
+        self._observation_space_cache.pop(env_key, None)
+        self._action_space_cache.pop(env_key, None)
         return {"message": f"Vectorized environment {env_id} created.", "env_key": env_key}
 
     def reset(self, env_key: str, seed: Optional[int], options: Optional[Any]):
@@ -141,24 +179,62 @@ class EnvAPI:
         return {"observation": convert_ndarrays_to_nested_lists(observation), "info": convert_ndarrays_to_nested_lists(info)}
 
     def step(self, env_key: str, action_data):
-        env = self.environments[env_key]
-        action = convert_nested_lists_to_ndarrays(action_data, dtype=np.float32)
-        observation, reward, terminated, truncated, info = env.step(action)
-        return {
-            "observation": convert_ndarrays_to_nested_lists(observation),
-            "reward": convert_ndarrays_to_nested_lists(reward),
-            "terminated": convert_ndarrays_to_nested_lists(terminated),
-            "truncated": convert_ndarrays_to_nested_lists(truncated),
-            "info": convert_ndarrays_to_nested_lists(info)
-        }
+        return self._step_fns[env_key](action_data)
+
+    @staticmethod
+    def _build_step_fn(env):
+        """Binds env.step and the converters once, so each step is a single call."""
+        env_step = env.step
+        to_ndarrays = convert_nested_lists_to_ndarrays
+        to_lists = convert_ndarrays_to_nested_lists
+        float32 = np.float32
+
+        def step_fn(action_data):
+            # Lists are parsed element by element; a binary ndarray envelope
+            # ({"__nd__": True, "dtype", "shape", "data"}) is one frombuffer copy.
+            action = to_ndarrays(action_data, dtype=float32)
+            observation, reward, terminated, truncated, info = env_step(action)
+            return {
+                "observation": to_lists(observation),
+                "reward": to_lists(reward),
+                "terminated": to_lists(terminated),
+                "truncated": to_lists(truncated),
+                "info": to_lists(info)
+            }
+        return step_fn
+
+    def step_batch(self, calls):
+        """
+        Steps several environments from a single request.
+
+        `calls` is a list of (env_key, action) pairs. The reply holds one list per
+        step field, ordered like `calls`, so N steps cost one frame each way.
+        """
+        results = [self.step(env_key, action_data) for env_key, action_data in calls]
+        return {key: [result[key] for result in results] for key in STEP_RESULT_KEYS}
 
     def action_space(self, env_key: str):
-        return replace_nans_infs(space_to_dict(self.environments[env_key].action_space))
+        # Returns the already packed response; serialized once per env_key.
+        packed_response = self._action_space_cache.get(env_key)
+        if packed_response is None:
+            space = self.environments[env_key].action_space
+            packed_response = self.pack_response(replace_nans_infs(space_to_dict(space)))
+            self._action_space_cache[env_key] = packed_response
+        return packed_response
 
     def observation_space(self, env_key: str):
-        return replace_nans_infs(space_to_dict(self.environments[env_key].observation_space))
+        # Returns the already packed response; serialized once per env_key.
+        packed_response = self._observation_space_cache.get(env_key)
+        if packed_response is None:
+            space = self.environments[env_key].observation_space
+            packed_response = self.pack_response(replace_nans_infs(space_to_dict(space)))
+            self._observation_space_cache[env_key] = packed_response
+        return packed_response
 
     def close(self, env_key: str):
+        self._step_fns.pop(env_key, None)
+        self._observation_space_cache.pop(env_key, None)
+        self._action_space_cache.pop(env_key, None)
         if env_key in self.environments:
             self.environments[env_key].close()
             del self.environments[env_key]
@@ -15,6 +15,7 @@ class EnvServer(EnvAPI):
         env_id,
         env_idx,
         num_agents,
+        shutdown_event=None,
     ):
 
         if env_type.lower() == "gym":
@@ -49,7 +50,8 @@ class EnvServer(EnvAPI):
         else:
             raise ValueError(f"Unknown env type '{env_type}'. Choose 'unity' or 'gym'.")
 
-        super().__init__(env_wrapper, remote_training_key, agent_gpt_server_url, env_idx, num_agents)
+        super().__init__(env_wrapper, remote_training_key, agent_gpt_server_url, env_idx, num_agents,
+                         shutdown_event=shutdown_event)
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.shutdown()
@@ -68,7 +70,7 @@ class EnvServer(EnvAPI):
     @classmethod
     def launch(cls, remote_training_key, agent_gpt_server_url, 
                env_type, env_id,
-               env_idx, num_agents) -> "EnvServer":
+               env_idx, num_agents, shutdown_event=None) -> "EnvServer":
         instance = cls(
             remote_training_key=remote_training_key,
             agent_gpt_server_url=agent_gpt_server_url,
@@ -76,6 +78,7 @@ class EnvServer(EnvAPI):
             env_id=env_id,
             env_idx=env_idx,
             num_agents=num_agents,
+            shutdown_event=shutdown_event,
         ) 
         instance.run_thread_server()
         return instance
\ No newline at end of file
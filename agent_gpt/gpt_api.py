@@ -1,12 +1,92 @@
 # gpt_api.py
+import math
 import numpy as np
 import json
+import msgpack
 from typing import List, Optional, Union, Dict
+try:
+    import orjson
+except ImportError:  # optional; only needed for wire_format="orjson"
+    orjson = None
 from .utils.conversion_utils import (
     convert_ndarrays_to_nested_lists,
     convert_nested_lists_to_ndarrays,
+    encode_ndarray_envelope,
+    decode_ndarray_envelope,
 )
 
+MSGPACK_CONTENT_TYPE = "application/x-msgpack"
+WIRE_FORMATS = ("json", "orjson", "msgpack")
+# Numeric dtype kinds that round-trip losslessly through tobytes()/frombuffer().
+_RAW_DTYPE_KINDS = "biuf"
+
+def _pack_ndarray(obj):
+    """msgpack `default` hook: numeric arrays travel as one raw buffer plus dtype/shape."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in _RAW_DTYPE_KINDS:
+            return encode_ndarray_envelope(obj, binary=True)
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize object of type {type(obj)}")
+
+def _unpack_ndarray(obj):
+    """msgpack `object_hook`: rebuild arrays packed by _pack_ndarray."""
+    if obj.get("__nd__") is True:
+        # The decoded array views immutable bytes; copy so callers get a writable array.
+        return decode_ndarray_envelope(obj).copy()
+    return obj
+
+def _orjson_default(obj):
+    # orjson serializes contiguous numeric arrays itself and falls through here
+    # for the rest (object/str dtypes, non-contiguous views).
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize object of type {type(obj)}")
+
+def _has_non_finite(obj) -> bool:
+    """True if `obj` holds a NaN/Infinity float, which orjson would write as null."""
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind in "fc" and not np.isfinite(obj).all()
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, np.floating):
+        return not np.isfinite(obj)
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    return False
+
+def _orjson_dumps(payload) -> bytes:
+    if _has_non_finite(payload):
+        # Keep stdlib json's NaN/Infinity tokens rather than orjson's null.
+        return json.dumps(convert_ndarrays_to_nested_lists(payload)).encode("utf-8")
+    return orjson.dumps(
+        payload,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+
+def _orjson_loads(data: bytes):
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson rejects the NaN/Infinity tokens stdlib json emits and accepts.
+        return json.loads(data.decode("utf-8"))
+
+# InvokeEndpoint error codes for a request the endpoint received and refused
+# (the container answered with an error, or the request was invalid), as
+# opposed to throttling or transport failures, which are worth retrying.
+_ENDPOINT_REJECTION_CODES = ("ModelError", "ValidationError")
+
+def _rejected_by_endpoint(exc: Exception) -> bool:
+    """True if `exc` is a botocore ClientError carrying one of _ENDPOINT_REJECTION_CODES."""
+    response = getattr(exc, "response", None)
+    if not isinstance(response, dict):
+        return False
+    return response.get("Error", {}).get("Code") in _ENDPOINT_REJECTION_CODES
+
 ###############################################################################
 # GPTAPI: a base class that handles interaction with a SageMaker endpoint
 ###############################################################################
@@ -41,28 +121,98 @@ class GPTAPI:
     back to NumPy arrays or Python data structures where appropriate.
     """
 
-    def __init__(self, predictor):
+    def __init__(self, predictor, wire_format: str = "json", batch_requests: bool = False):
         """
         :param predictor: An object (typically a sagemaker Predictor) that has 
                           `.predict(bytes)` and `.endpoint_name` attributes.
+        :param wire_format: "json" (default), "orjson" or "msgpack". "orjson" is
+                          the same JSON on the wire, encoded by orjson without
+                          converting NumPy arrays to nested lists first (needs
+                          the orjson package). With "msgpack", NumPy arrays are
+                          sent as raw buffers; the endpoint must accept
+                          application/x-msgpack.
+        :param batch_requests: Set when the endpoint implements the "batch"
+                          action, so helpers like init_session can send several
+                          requests in one round trip. Turned off automatically
+                          if the endpoint rejects a batch request.
         """
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of {WIRE_FORMATS}, got '{wire_format}'")
+        if wire_format == "orjson" and orjson is None:
+            raise ImportError('wire_format="orjson" requires orjson (pip install agent-gpt-aws[orjson])')
         self.__predictor = predictor
         self.endpoint_name = self.__predictor.endpoint_name
+        self.wire_format = wire_format
+        self._batch_supported = batch_requests
 
     def _invoke(self, action: str, args: dict) -> Dict:
         """
-        Internal helper for sending JSON payloads to the SageMaker endpoint 
-        and parsing JSON responses.
+        Internal helper for sending payloads to the SageMaker endpoint 
+        and parsing responses, in JSON or msgpack depending on `wire_format`.
 
         :param action: String name of the server-recognized action.
         :param args: A dict of arguments to include in the request payload.
         :return: Parsed JSON response (dict).
         """
         payload = {"action": action, "args": args}
-        request_str = json.dumps(payload)
-        response_bytes = self.__predictor.predict(request_str.encode("utf-8"))
-        response_str = response_bytes.decode("utf-8")
-        return json.loads(response_str)
+        if self.wire_format == "msgpack":
+            request_bytes = msgpack.packb(payload, default=_pack_ndarray, use_bin_type=True)
+            response_bytes = self.__predictor.predict(
+                request_bytes,
+                initial_args={"ContentType": MSGPACK_CONTENT_TYPE, "Accept": MSGPACK_CONTENT_TYPE},
+            )
+            # An endpoint that doesn't speak msgpack still answers with a JSON object.
+            if response_bytes[:1] != b"{":
+                return msgpack.unpackb(response_bytes, object_hook=_unpack_ndarray, raw=False)
+            return json.loads(response_bytes.decode("utf-8"))
+        if self.wire_format == "orjson":
+            response_bytes = self.__predictor.predict(_orjson_dumps(payload))
+            return _orjson_loads(response_bytes)
+        response_bytes = self.__predictor.predict(json.dumps(payload).encode("utf-8"))
+        return json.loads(response_bytes.decode("utf-8"))
+
+    def _invoke_many(self, ops: List[tuple]) -> List[Dict]:
+        """
+        Send several (action, args) requests, in one round trip using the
+        server's "batch" action when the endpoint supports it.
+
+        :param ops: A list of (action, args) tuples, as passed to _invoke.
+        :return: One parsed response per op, in order. Without "batch" support
+                 (see `batch_requests`), the ops are sent one by one.
+        :raises: Throttling and transport errors from the batch request, as
+                 for any other call; they don't turn batching off.
+        """
+        ops = [(action, self._prepare(args)) for action, args in ops]
+        if self._batch_supported:
+            try:
+                response = self._invoke("batch", {"ops": [{"action": action, "args": args} for action, args in ops]})
+            except Exception as e:
+                if not _rejected_by_endpoint(e):
+                    raise
+                response = {}
+            results = response.get("results")
+            if results is not None:
+                return results
+            # The endpoint doesn't understand "batch"; don't send it again.
+            self._batch_supported = False
+        return [self._invoke(action, args) for action, args in ops]
+
+    def warmup(self):
+        """
+        Issue one cheap request so the HTTPS connection to the endpoint is
+        opened before the first latency-sensitive select_action call.
+        AgentGPT.infer calls this before returning the client.
+        """
+        self._invoke("get_num_agents", {})
+
+    def _prepare(self, data):
+        """
+        Make `data` sendable in the current wire format: msgpack and orjson
+        encode arrays directly, stdlib json needs them as nested lists.
+        """
+        if self.wire_format != "json":
+            return data
+        return convert_ndarrays_to_nested_lists(data)
 
     # -------------------------------------------------------------------------
     # Core RL/GPT actions (mirroring serve.py endpoints)
@@ -92,9 +242,17 @@ class GPTAPI:
             A NumPy array of actions (np.float32), shape depends on the server’s
             action space. (The server typically returns {"action": ...}.)
         """
-        agent_ids = convert_ndarrays_to_nested_lists(agent_ids)
-        observations = convert_ndarrays_to_nested_lists(observations)
-        terminated_agent_ids = convert_ndarrays_to_nested_lists(terminated_agent_ids)
+        agent_ids = self._prepare(agent_ids)
+        if (isinstance(observations, list) and observations
+                and all(type(o) is np.ndarray for o in observations)
+                and all(o.shape == observations[0].shape and o.dtype == observations[0].dtype
+                        for o in observations)):
+            # Same-shape, same-dtype per-agent arrays: stack once so they're encoded
+            # as one contiguous (num_agents, *obs_shape) array. The JSON form is
+            # identical; mixed dtypes would be upcast by np.stack, so they're left alone.
+            observations = np.stack(observations)
+        observations = self._prepare(observations)
+        terminated_agent_ids = self._prepare(terminated_agent_ids)
         args = {
             "agent_ids": agent_ids,
             "observations": observations,
@@ -147,7 +305,7 @@ class GPTAPI:
             The server response, which may include a message about which agents 
             were terminated successfully.
         """
-        terminated_agent_ids = convert_ndarrays_to_nested_lists(terminated_agent_ids)
+        terminated_agent_ids = self._prepare(terminated_agent_ids)
         response = self._invoke("terminate_agents", {"terminated_agent_ids": terminated_agent_ids})
         return response
 
@@ -251,8 +409,8 @@ class GPTAPI:
             Boolean: True on success, False otherwise. Check the server
             response's 'message' for more details if needed.
         """
-        agent_ids = convert_ndarrays_to_nested_lists(agent_ids)
-        control_value = convert_ndarrays_to_nested_lists(control_value)
+        agent_ids = self._prepare(agent_ids)
+        control_value = self._prepare(control_value)
 
         response = self._invoke(
             "set_control_value",
@@ -269,7 +427,7 @@ class GPTAPI:
         :return:
             A server response (often a dict mapping agent_id -> float).
         """
-        agent_ids = convert_ndarrays_to_nested_lists(agent_ids)
+        agent_ids = self._prepare(agent_ids)
         response = self._invoke("get_control_value", {"agent_ids": agent_ids})
         return response
 
@@ -283,6 +441,28 @@ class GPTAPI:
             A dictionary representing the server’s status (keys/structure 
             depend on the server implementation).
         """
-        agent_ids = convert_ndarrays_to_nested_lists(agent_ids)
+        agent_ids = self._prepare(agent_ids)
         response = self._invoke("status", {"agent_ids": agent_ids})
         return response
+
+    def init_session(self):
+        """
+        Fetch the settings usually read back-to-back at startup, in a single
+        round trip when `batch_requests` is set (see _invoke_many).
+
+        :return:
+            A dict with "max_input_states", "num_input_states",
+            "control_value" (the get_control_value response) and "status".
+        """
+        max_states, num_states, control_value, status = self._invoke_many([
+            ("get_max_input_states", {}),
+            ("get_num_input_states", {}),
+            ("get_control_value", {"agent_ids": None}),
+            ("status", {"agent_ids": None}),
+        ])
+        return {
+            "max_input_states": int(max_states.get("max_input_states")),
+            "num_input_states": int(num_states.get("num_input_states")),
+            "control_value": control_value,
+            "status": status,
+        }
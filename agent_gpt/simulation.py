@@ -3,6 +3,7 @@ import typer
 import os
 import platform
 import subprocess
+import threading
 from typing import List
 
 def open_simulation_in_screen(extra_args: List[str]) -> subprocess.Popen:
@@ -73,6 +74,8 @@ def main():
     base_agents, remainder = divmod(num_agents, num_envs)
     agents_per_env = [base_agents + (1 if i < remainder else 0) for i in range(num_envs)]
     
+    # One event shared by every launcher, so shutdown is a single set().
+    shutdown_event = threading.Event()
     launchers = []
     for i in range(num_envs):
         env_idx = i
@@ -84,6 +87,7 @@ def main():
                 env_id,
                 env_idx,
                 agents_per_env[i],
+                shutdown_event=shutdown_event,
             )
         )
     config_data["hyperparams"]["remote_training_key"] = remote_training_key  # fixed plural naming consistency
@@ -98,8 +102,7 @@ def main():
                 launcher.server_thread.join(timeout=0.5)
     except KeyboardInterrupt:
         typer.echo("Shutdown requested, stopping all servers...")
-        for launcher in launchers:
-            launcher.shutdown()
+        shutdown_event.set()
         for launcher in launchers:
             launcher.server_thread.join(timeout=2)
 
@@ -1,36 +1,89 @@
 import os
+import copy
+import functools
+import importlib
 import yaml
+from collections import OrderedDict
 from typing import List, Dict
 
-from ..config.hyperparams import Hyperparameters
-from ..config.sagemaker import SageMakerConfig
+# Prefer the libyaml C bindings; fall back to the pure-Python classes without them.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 from agent_gpt import __version__ as CURRENT_AGENT_GPT_VERSION
 
 DEFAULT_CONFIG_PATH = os.path.expanduser("~/.agent_gpt/config.yaml")
 
+# Section -> "module:Class". Classes are imported on first use via _resolve_config_class,
+# so commands that only parse arguments don't load every config module.
 TOP_CONFIG_CLASS_MAP = {
-    "hyperparams": Hyperparameters,
-    "sagemaker": SageMakerConfig,
+    "hyperparams": "agent_gpt.config.hyperparams:Hyperparameters",
+    "sagemaker": "agent_gpt.config.sagemaker:SageMakerConfig",
 }
 
+@functools.lru_cache(maxsize=None)
+def _resolve_config_class(section: str):
+    module_name, class_name = TOP_CONFIG_CLASS_MAP[section].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+# path -> (st_mtime_ns, st_size, parsed yaml), oldest entry first.
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+
+def _cached_yaml_load(path: str) -> Dict:
+    """
+    Parse a YAML file, reusing the previous result while the file's mtime and size
+    are unchanged. Callers get a deep copy, so mutating the result is safe.
+    """
+    stat = os.stat(path)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[2])
+
+    # One read into a buffer; the loader handles the UTF-8 decoding itself.
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        raw = f.read()
+    data = yaml.load(raw, Loader=SafeLoader) or {}
+    _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
 def load_config() -> Dict:
-    config = {}    
-    with open(DEFAULT_CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}
-    return config
+    return _cached_yaml_load(DEFAULT_CONFIG_PATH)
 
 def save_config(config_data: Dict) -> None:
+    # Don't rely on mtime resolution to notice our own writes.
+    _YAML_CACHE.pop(DEFAULT_CONFIG_PATH, None)
     config_data["version"] = CURRENT_AGENT_GPT_VERSION
-    with open(DEFAULT_CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(config_data, f, sort_keys=False, default_flow_style=False)
+    # Write next to the target and swap it in, so readers (e.g. the CLI polling while the
+    # simulation process saves) never see a half-written file.
+    tmp_path = f"{DEFAULT_CONFIG_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yaml.dump(config_data, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
+        os.replace(tmp_path, DEFAULT_CONFIG_PATH)
+    except BaseException:
+        # e.g. a value SafeDumper can't represent; don't leave the partial file behind.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
-def generate_default_section_config(section: str) -> Dict:
-    cls = TOP_CONFIG_CLASS_MAP.get(section)
-    if cls:
-        return cls().to_dict()
+@functools.lru_cache(maxsize=None)
+def _default_section_config(section: str) -> Dict:
+    if section in TOP_CONFIG_CLASS_MAP:
+        return _resolve_config_class(section)().to_dict()
     return {}
 
+def generate_default_section_config(section: str) -> Dict:
+    # Defaults only depend on the installed package; copy since callers mutate them.
+    return copy.deepcopy(_default_section_config(section))
+
 def generate_default_config() -> Dict:
     return { section: generate_default_section_config(section) for section in TOP_CONFIG_CLASS_MAP.keys() }
 
@@ -50,29 +103,45 @@ def convert_to_objects(config_data: Dict) -> Dict:
     Instantiate top-level configuration objects and apply stored config_data.
     """
     result = {}
-    for key, cls in TOP_CONFIG_CLASS_MAP.items():
-        obj = cls()  # __post_init__ in NetworkConfig will fetch network info automatically.
+    for key in TOP_CONFIG_CLASS_MAP:
+        obj = _resolve_config_class(key)()  # Plain dataclasses; constructing is cheaper than copying a prototype.
         obj.set_config(**config_data.get(key, {}))
         result[key] = obj
     return result
 
+_BOOL_STRINGS = {"true": True, "false": False}
+
 def parse_value(value: str):
     """
     Try converting the string to int, float, or bool.
     If all conversions fail, return the string.
+
+    int()/float() are only attempted when the text can start a number (digit, '.',
+    or nan/inf), so ordinary words never raise and catch a ValueError.
+    Values that are not strings are returned unchanged.
     """
-    try:
-        return int(value)
-    except (ValueError, TypeError):
-        pass
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        pass
-    if value is not None:
-        lower = value.lower()
-        if lower in ["true", "false"]:
-            return lower == "true"
+    if not isinstance(value, str):
+        return value
+    body = value.strip().lstrip("+-")
+    head = body[:1]
+    if head.isdigit() or head == ".":
+        if body.replace("_", "").isdigit():
+            try:
+                return int(value)
+            except ValueError:
+                pass
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    elif head in ("n", "N", "i", "I"):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    lower = value.lower()
+    if lower in _BOOL_STRINGS:
+        return _BOOL_STRINGS[lower]
     return value
 
 def parse_extra_args(args: List[str]) -> Dict:
@@ -84,34 +153,38 @@ def parse_extra_args(args: List[str]) -> Dict:
     Returns a nested dictionary of the parsed values.
     """
     new_changes = {}
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg.startswith("--"):
-            key = arg[2:]  # remove the leading "--"
-            i += 1
-            # Gather all subsequent arguments that do not start with '--'
-            values = []
-            while i < len(args) and not args[i].startswith("--"):
-                values.append(args[i])
-                i += 1
-
-            # Determine if we have no values, a single value, or multiple values.
-            if not values:
-                parsed_value = None
-            elif len(values) == 1:
-                parsed_value = parse_value(values[0])
-            else:
-                parsed_value = [parse_value(val) for val in values]
+    parse = parse_value
+    # Positions of every --flag; a flag's values run up to the next flag.
+    flag_positions = [i for i, arg in enumerate(args) if arg.startswith("--")]
+    flag_positions.append(len(args))
+    # Dotted prefix -> nested dict, so sibling keys skip the setdefault chain.
+    containers = {(): new_changes}
+
+    for start, end in zip(flag_positions, flag_positions[1:]):
+        keys = tuple(args[start][2:].split("."))  # remove the leading "--"
+        values = args[start + 1:end]
 
-            # Build a nested dictionary using dot notation.
-            keys = key.split(".")
+        # Determine if we have no values, a single value, or multiple values.
+        if not values:
+            parsed_value = None
+        elif len(values) == 1:
+            parsed_value = parse(values[0])
+        else:
+            parsed_value = [parse(val) for val in values]
+
+        # Build a nested dictionary using dot notation.
+        parent = keys[:-1]
+        d = containers.get(parent)
+        if d is None:
             d = new_changes
-            for sub_key in keys[:-1]:
+            for depth, sub_key in enumerate(parent, 1):
                 d = d.setdefault(sub_key, {})
-            d[keys[-1]] = parsed_value
-        else:
-            i += 1
+                containers[parent[:depth]] = d
+        if isinstance(d, dict) and isinstance(d.get(keys[-1]), dict):
+            # A nested dict is being replaced; forget cached paths beneath it.
+            for path in [path for path in containers if path[:len(keys)] == keys]:
+                del containers[path]
+        d[keys[-1]] = parsed_value
     return new_changes
 
 def recursive_update(target, changes: Dict, prefix="") -> List:
@@ -119,40 +192,43 @@ def recursive_update(target, changes: Dict, prefix="") -> List:
     Recursively update attributes of an object (or dictionary) using a nested changes dict.
     Only updates existing attributes/keys.
 
+    Walks the changes with an explicit stack instead of recursive calls. Each entry
+    keeps its own iterator, so the parent resumes after a nested dict is done and the
+    log keeps the same depth-first order.
+
     Returns:
         list of tuples: Each tuple is (full_key, old_value, new_value, updated, message),
         where 'updated' is a boolean indicating if an update was performed.
     """
     update_log = []
-    if isinstance(target, dict):
-        for k, new_val in changes.items():
-            if k in target:
-                current_key = f"{prefix}.{k}" if prefix else k
-                if isinstance(new_val, dict):
-                    update_log.extend(recursive_update(target[k], new_val, prefix=current_key))
-                else:
-                    if target[k] != new_val:
-                        old_val = target[k]
-                        target[k] = new_val
-                        update_log.append((current_key, old_val, new_val, True, ""))
-                    else:
-                        update_log.append((current_key, target[k], new_val, False, "value unchanged"))
-            # Do not add new keys.
-    else:
-        for attr, new_val in changes.items():
-            if not hasattr(target, attr):
-                continue
-            current_val = getattr(target, attr)
-            current_key = f"{prefix}.{attr}" if prefix else attr
-            if isinstance(new_val, dict):
-                update_log.extend(recursive_update(current_val, new_val, prefix=current_key))
+    append = update_log.append
+    stack = [(target, iter(changes.items()), prefix)]
+    while stack:
+        target, items, prefix = stack[-1]
+        is_dict = isinstance(target, dict)
+        for key, new_val in items:
+            if is_dict:
+                if key not in target:
+                    continue  # Do not add new keys.
+                current_val = target[key]
             else:
-                if current_val != new_val:
-                    old_val = current_val
-                    setattr(target, attr, new_val)
-                    update_log.append((current_key, old_val, new_val, True, ""))
+                if not hasattr(target, key):
+                    continue
+                current_val = getattr(target, key)
+            current_key = f"{prefix}.{key}" if prefix else key
+            if isinstance(new_val, dict):
+                stack.append((current_val, iter(new_val.items()), current_key))
+                break
+            if current_val != new_val:
+                if is_dict:
+                    target[key] = new_val
                 else:
-                    update_log.append((current_key, current_val, new_val, False, "value unchanged"))
+                    setattr(target, key, new_val)
+                append((current_key, current_val, new_val, True, ""))
+            else:
+                append((current_key, current_val, new_val, False, "value unchanged"))
+        else:
+            stack.pop()
     return update_log
 
 def update_config_by_dot_notation(config_obj, new_changes) -> List:
@@ -163,6 +239,13 @@ def update_config_by_dot_notation(config_obj, new_changes) -> List:
         list of tuples: Each tuple is (key, old_value, new_value, changed, message)
     """
     update_log = []
+    # Attribute name -> first config object holding it, built once per call.
+    # Methods (e.g. set_exploration) are not in vars() and fall back to the scan.
+    attr_owners = {}
+    for obj in config_obj.values():
+        for attr_name in vars(obj):
+            attr_owners.setdefault(attr_name, obj)
+
     for key, new_val in new_changes.items():
         # Allow shorthand syntax for top-level config sections.
         if key in config_obj and isinstance(new_val, dict) and len(new_val) == 1:
@@ -170,11 +253,12 @@ def update_config_by_dot_notation(config_obj, new_changes) -> List:
             key = inner_key
             new_val = inner_value
 
-        matching_obj = None
-        for obj in config_obj.values():
-            if hasattr(obj, key):
-                matching_obj = obj
-                break
+        matching_obj = attr_owners.get(key)
+        if matching_obj is None:
+            for obj in config_obj.values():
+                if hasattr(obj, key):
+                    matching_obj = obj
+                    break
         
         if matching_obj is None:
             update_log.append((key, None, None, False, "it was not found in the configuration"))
@@ -200,12 +284,11 @@ def update_config_by_dot_notation(config_obj, new_changes) -> List:
         elif isinstance(new_val, dict):
             update_log.extend(recursive_update(attr, new_val, prefix=key))
         else:
-            current_val = getattr(matching_obj, key)
-            if current_val != new_val:
+            if attr != new_val:
                 setattr(matching_obj, key, new_val)
-                update_log.append((key, current_val, new_val, True, ""))
+                update_log.append((key, attr, new_val, True, ""))
             else:
-                update_log.append((key, current_val, new_val, False, "value unchanged"))
+                update_log.append((key, attr, new_val, False, "value unchanged"))
     return update_log
 
 def update_config_using_method(args: List[str], config_obj: Dict) -> List:
@@ -14,6 +14,11 @@ for AgentGPT. It includes functions for:
          Recursively converts NumPy arrays back to Python lists, preserving dict/tuple structures,
          ensuring the data is JSON-friendly.
      
+     - encode_ndarray_envelope(array, binary) / decode_ndarray_envelope(envelope):
+         Pack a numeric array as {"__nd__": True, "dtype", "shape"} plus its raw buffer, either as
+         bytes under "data" (msgpack) or base64 under "b64" (JSON), and back.
+         convert_nested_lists_to_ndarrays decodes such envelopes automatically.
+     
      - replace_nans_infs(obj):
          Recursively scans a nested structure (lists, tuples, dicts) for NaN or ±Inf float values and
          replaces them with the strings "NaN", "Infinity", or "-Infinity".
@@ -30,6 +35,7 @@ for AgentGPT. It includes functions for:
          Recursively deserializes a Python dict (produced by space_to_Dict) back into the corresponding Gymnasium
          space, restoring the NumPy arrays as necessary.
 """
+import base64
 import numpy as np
 import gymnasium as gym
 from typing import Dict, Tuple
@@ -46,37 +52,88 @@ def convert_nested_lists_to_ndarrays(data, dtype):
     Returns:
         The data with all lists converted to NumPy arrays where applicable.
     """
-    if isinstance(data, list):
+    if type(data) is np.ndarray:
+        # Already decoded (e.g. from a msgpack envelope): only the dtype may need fixing.
+        return data if dtype is None else data.astype(dtype, copy=False)
+    elif isinstance(data, list):
         if all(item is not None for item in data):
+            # Rectangular numeric lists convert in one C-level pass. Object results
+            # (dicts, envelopes, strings) and anything numpy rejects (ragged rows)
+            # go the recursive way so nested items are still converted.
+            try:
+                array = np.array(data, dtype=dtype)
+                if array.dtype != object:
+                    return array
+            except (ValueError, TypeError):
+                pass
             return np.array([convert_nested_lists_to_ndarrays(item, dtype) for item in data], dtype=dtype)
         else:
             return [convert_nested_lists_to_ndarrays(item, dtype) if item is not None else None for item in data]
     elif isinstance(data, tuple):
         return tuple(convert_nested_lists_to_ndarrays(item, dtype) for item in data)
     elif isinstance(data, dict):
+        if data.get("__nd__") is True:
+            array = decode_ndarray_envelope(data)
+            return array if dtype is None else array.astype(dtype)
         return {key: convert_nested_lists_to_ndarrays(value, dtype) for key, value in data.items()}
     else:
         return data
 
+def encode_ndarray_envelope(array: np.ndarray, binary: bool = False) -> Dict:
+    """
+    Packs a numeric NumPy array into an envelope holding its raw buffer instead of
+    one number per element: bytes under "data" when `binary` (for msgpack), base64
+    text under "b64" otherwise (for JSON).
+    """
+    array = np.ascontiguousarray(array)
+    envelope = {"__nd__": True, "dtype": array.dtype.str, "shape": list(array.shape)}
+    if binary:
+        envelope["data"] = array.tobytes()
+    else:
+        envelope["b64"] = base64.b64encode(array.tobytes()).decode("ascii")
+    return envelope
+
+def decode_ndarray_envelope(envelope: Dict) -> np.ndarray:
+    """Inverse of encode_ndarray_envelope. The result is a read-only view of the decoded bytes."""
+    buffer = envelope["data"] if "data" in envelope else base64.b64decode(envelope["b64"])
+    return np.frombuffer(buffer, dtype=envelope["dtype"]).reshape(envelope["shape"])
+
+# Types convert_ndarrays_to_nested_lists has to descend into; anything else is a leaf.
+_NESTED_TYPES = (np.ndarray, list, tuple, dict)
+
 def convert_ndarrays_to_nested_lists(data):
     """
     Recursively converts all NumPy arrays in a nested structure (dict, list, Tuple)
     to Python lists while preserving the original structure.
 
+    Leaf values are copied inline instead of through a recursive call, so only
+    containers and arrays cost an extra Python frame.
+
     Args:
         data: The input data, which can be a dict, list, tuple, or np.ndarray.
 
     Returns:
         The data with all NumPy arrays converted to Python lists.
     """
-    if isinstance(data, np.ndarray):
+    # Exact-type checks first: identity compares skip isinstance's MRO walk for
+    # the common cases; subclasses (OrderedDict, namedtuples, ...) fall through.
+    data_type = type(data)
+    if data_type is np.ndarray:
+        return data.tolist()
+    elif data_type is dict:
+        return {key: convert_ndarrays_to_nested_lists(value) if isinstance(value, _NESTED_TYPES) else value
+                for key, value in data.items()}
+    elif isinstance(data, np.ndarray):
         return data.tolist()
     elif isinstance(data, list):
-        return [convert_ndarrays_to_nested_lists(item) for item in data]
+        return [convert_ndarrays_to_nested_lists(item) if isinstance(item, _NESTED_TYPES) else item
+                for item in data]
     elif isinstance(data, tuple):
-        return tuple(convert_ndarrays_to_nested_lists(item) for item in data)
+        return tuple(convert_ndarrays_to_nested_lists(item) if isinstance(item, _NESTED_TYPES) else item
+                     for item in data)
     elif isinstance(data, dict):
-        return {key: convert_ndarrays_to_nested_lists(value) for key, value in data.items()}
+        return {key: convert_ndarrays_to_nested_lists(value) if isinstance(value, _NESTED_TYPES) else value
+                for key, value in data.items()}
     else:
         return data
 
@@ -1,7 +1,11 @@
 # env_wrapper/gym_env.py
 import gymnasium as gym
 
-class GymEnv:
+class GymEnv(gym.Wrapper):
+    """
+    Wraps a single Gymnasium environment. step/reset/close are inherited from
+    gym.Wrapper and forward straight to the underlying env.
+    """
     def __init__(self, env, **kwargs):
         """
         Initialize the GymEnv wrapper.
@@ -11,17 +15,19 @@ class GymEnv:
             **kwargs: Additional keyword arguments that can be stored for custom behavior.
                 For example, 'your_attr' can be used to store custom configuration.
         """
-        self.env = env                     # Underlying Gym environment
+        super().__init__(env)              # Underlying Gym environment, stored as self.env
         self.kwargs = kwargs               # Save extra keyword arguments
         self.your_attr = kwargs.get("your_attr", {})  # Custom attribute for any extra data
-        self.observation_space = env.observation_space  # Mirror the observation space of the underlying env
-        self.action_space = env.action_space            # Mirror the action space of the underlying env
 
-    def __exit__(self, exc_type, exc_value, traceback):
+    def __getattr__(self, name):
         """
-        Ensure that the environment is closed when exiting a context.
+        Forward attributes the wrapper doesn't define (observation_space, action_space,
+        num_envs, ...) to the underlying env, so they always reflect its current state.
+        Only called when normal lookup fails, so step/reset/close are unaffected.
         """
-        self.close()
+        if name == "env":
+            raise AttributeError(name)
+        return getattr(self.env, name)
 
     # Factory methods to create environments with the custom wrapper
     @staticmethod
@@ -42,7 +48,7 @@ class GymEnv:
     @staticmethod
     def make_vec(env_id, num_envs, **kwargs):
         """
-        Create a vectorized environment wrapped by GymEnv.
+        Create a vectorized environment wrapped by GymVecEnv.
 
         Args:
             env_id (str): The Gymnasium environment ID.
@@ -50,39 +56,10 @@ class GymEnv:
             **kwargs: Additional keyword arguments to pass to gym.make_vec and store in the wrapper.
 
         Returns:
-            GymEnv: An instance of GymEnv wrapping the vectorized environment.
-        """
-        # Create a vectorized environment and wrap it.
-        return GymEnv(gym.make_vec(env_id, num_envs=num_envs, **kwargs), **kwargs)
-
-    def reset(self, **kwargs):
+            GymVecEnv: An instance of GymVecEnv wrapping the vectorized environment.
         """
-        Reset the underlying environment.
-
-        Returns:
-            The initial observation and any additional info provided by the env's reset.
-        """
-        return self.env.reset(**kwargs)
-
-    def step(self, action):
-        """
-        Take a step in the underlying environment using the given action.
-
-        Args:
-            action: The action to be executed in the environment.
-
-        Returns:
-            A tuple (observation, reward, terminated, truncated, info) as returned by the env.
-        """
-        return self.env.step(action)
-
-    def close(self):
-        """
-        Close the underlying environment and clean up resources.
-        """
-        if self.env:
-            self.env.close()
-            self.env = None
+        # gym.Wrapper only accepts gym.Env, so vector envs get the VectorWrapper counterpart.
+        return GymVecEnv(gym.make_vec(env_id, num_envs=num_envs, **kwargs), **kwargs)
 
     @classmethod
     def register(cls, env_id, env_entry_point, env_dir):
@@ -99,13 +76,11 @@ class GymEnv:
             - Otherwise, it attempts to register using Gymnasium's registration.register.
         """
         from gymnasium.envs import registration
-        from gymnasium.error import UnregisteredEnv  # For older versions, it might be gym.error.Error
-        import gymnasium
-        try:
-            # Check if the environment is already registered.
-            gymnasium.spec(env_id)
+        # The registry is a plain dict keyed by env id; test membership directly
+        # instead of raising and catching UnregisteredEnv.
+        if env_id in registration.registry:
             print(f"Environment {env_id} is already registered; skipping registration.")
-        except UnregisteredEnv:
+        else:
             print(f"Registering Gym environment: {env_id} with entry_point: {env_entry_point}")
             try:
                 registration.register(
@@ -116,6 +91,21 @@ class GymEnv:
                 print(f"Error registering environment {env_id}: {e}")
                 raise e
 
+class GymVecEnv(gym.vector.VectorWrapper):
+    """
+    Vectorized counterpart of GymEnv, returned by GymEnv.make_vec.
+    """
+    def __init__(self, env, **kwargs):
+        super().__init__(env)
+        self.kwargs = kwargs
+        self.your_attr = kwargs.get("your_attr", {})
+
+    def __getattr__(self, name):
+        # Same forwarding as GymEnv.__getattr__.
+        if name == "env":
+            raise AttributeError(name)
+        return getattr(self.env, name)
+
 def is_gymnasium_envs(env_id: str):
     """
     Retrieves environment IDs grouped by specified categories based on entry points in the Gymnasium registry.
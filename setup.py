@@ -13,7 +13,7 @@ cli_dependencies = [
     "websocket-client",
     "pyyaml",
     "boto3",
-    "sagemaker",
+    "sagemaker>=2.224.0",  # Model.deploy(routing_config=...)
 ]
 
 # Combine the two lists
@@ -37,6 +37,7 @@ setup(
     extras_require={
          "mujoco": ["gymnasium[mujoco]"],
          "mlagents": ["mlagents_envs==0.30.0", "protobuf==3.20.0"],
+         "orjson": ["orjson"],
     },        
     author="JunHo Park",
     author_email="junho@ccnets.org",